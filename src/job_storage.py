@@ -385,6 +385,30 @@ class JobStorage:
                 return True
             return False
     
+    def delete_jobs(self, job_ids: List[str]) -> int:
+        """Delete multiple jobs in one batch (minimizes API calls)."""
+        if not job_ids:
+            return 0
+        if self._use_sheets:
+            try:
+                count = self._sheets_client.delete_jobs(job_ids)
+                if count:
+                    self._invalidate_jobs_cache()
+                return count
+            except Exception as e:
+                print(f"Error deleting jobs from sheets: {e}")
+                return 0
+        else:
+            jobs = self._get_all_jobs_local()
+            ids_set = {job_id for job_id in job_ids if job_id}
+            # Same filter as delete_job (every matching row goes); counted per ID like Sheets
+            remaining = [job for job in jobs if job.id not in ids_set]
+            count = len({job.id for job in jobs} & ids_set)
+            if count:
+                self._save_jobs_local(remaining)
+                self._invalidate_jobs_cache()
+            return count
+    
     def get_job_by_id(self, job_id: str) -> Optional[StoredJob]:
         """Get a specific job by ID"""
         jobs = self.get_all_jobs()
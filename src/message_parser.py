@@ -1,13 +1,16 @@
 """Message parser for extracting job data from text messages"""
 import re
 from datetime import date
-from typing import List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedJob:
-    """Represents a parsed job from a text message"""
+    """Represents a parsed job from a text message (immutable, results are cached)"""
     address: str
     total: float
     parts: float
@@ -65,8 +68,10 @@ class MessageParser:
     # Pattern for "$325 parts $10" (price with parts on same line)
     PRICE_WITH_PARTS_PATTERN = re.compile(r'\$(\d+(?:\.\d{2})?)\s*parts?\s*\$?(\d+(?:\.\d{2})?)', re.IGNORECASE)
     
-    # Standalone price ($446 or 446$) - more flexible, also handles just "400$" or "$400" on a line
-    STANDALONE_PRICE_PATTERN = re.compile(r'^\s*\$(\d+(?:\.\d{2})?)\s*$|^\s*(\d+(?:\.\d{2})?)\$?\s*$', re.MULTILINE)
+    # Standalone price ($446 or 446$) - more flexible, also handles just "400$" or "$400" on a line.
+    # A price takes a leading or a trailing "$", never both ("$400$" is not a price).
+    # Applied to one line at a time (no MULTILINE), see _find_standalone_price.
+    STANDALONE_PRICE_LINE_PATTERN = re.compile(r'^\s*(?:\$(\d+(?:\.\d{2})?)|(\d+(?:\.\d{2})?)\$?)\s*$')
     
     # Pattern for "Total XXX Zelle to Name" format
     TOTAL_ZELLE_PATTERN = re.compile(r'total\s*\$?(\d+(?:\.\d{2})?)\$?\s*zelle', re.IGNORECASE)
@@ -82,6 +87,57 @@ class MessageParser:
     # Parts pattern - more flexible (parts $10, parts$10, part $10, part$15)
     PARTS_PATTERN = re.compile(r'parts?\s*\$?\s*(\d+(?:\.\d{2})?)', re.IGNORECASE)
     
+    # Total formats in _extract_total priority order: (pattern, payment method,
+    # literal keywords one of which the text must contain for the pattern to match)
+    TOTAL_PATTERNS = (
+        (TOTAL_CASH_PATTERN, 'cash', ('total',)),            # "Total cash XXX"
+        (TOTAL_CHECK_PATTERN, 'check', ('total',)),          # "Total check XXX"
+        (TOTAL_CC_PATTERN, 'cc', ('total',)),                # "Total cc/credit XXX"
+        (TOTAL_ZELLE_PATTERN, 'check', ('zelle',)),          # "Total XXX Zelle" (Zelle is treated as check)
+        (PRICE_WITH_PARTS_PATTERN, 'cash', ('part',)),       # "$325 parts $10" (parts extracted separately)
+        (PRICE_IN_CASH_PATTERN, 'cash', ('cash',)),          # "XXX$ in cash"
+        (PRICE_IN_CHECK_PATTERN, 'check', ('check',)),       # "XXX$ in check"
+        (PRICE_IN_CC_PATTERN, 'cc', ('cc', 'credit', 'card')),  # "XXX$ in cc"
+        (PRICE_IN_ZELLE_PATTERN, 'check', ('zelle',)),       # "850 zelle to oren"
+        (RUN_CC_PATTERN, 'cc', ('cc',)),                     # "Total cc Oren run cc 486.60$"
+    )
+    
+    # Existence probe for any of the pricing patterns above, run once over a whole
+    # message: a line matches iff one of TOTAL_CASH/CHECK/CC, RUN_CC, TOTAL_ZELLE,
+    # PRICE_IN_*, STANDALONE_PRICE_LINE or PARTS would match it on its own.
+    # [^\S\n] is whitespace other than a newline, so matches never span lines.
+    PRICING_PROBE_PATTERN = re.compile(
+        r'total[^\S\n]*(?:cash|check|cc|credit|card)[^\S\n]*:?[^\S\n]*\$?[\d,]|'
+        r'cc[^\S\n]*\$?[\d,]|'
+        r'\d\$?[^\S\n]*(?:in[^\S\n]*)?(?:cash|check|cc|credit|card|zelle)|'
+        r'^[^\S\n]*(?:\$\d+(?:\.\d{2})?|\d+(?:\.\d{2})?\$?)[^\S\n]*$|'
+        r'parts?[^\S\n]*\$?[^\S\n]*\d',
+        re.IGNORECASE | re.MULTILINE
+    )
+    
+    # Line that ends a description: phone, alpha job, total cash/check, standalone
+    # price or parts (existence form of PHONE, ALPHA_JOB, TOTAL_CASH/CHECK,
+    # STANDALONE_PRICE_LINE and PARTS patterns, one scan per line)
+    DESCRIPTION_STOP_PATTERN = re.compile(
+        r'[\(\-]?\d{3}[\)\-\s]*\d{3}[\-\s]*\d{4}|'
+        r'alpha\s*job|'
+        r'total\s*(?:cash|check)\s*:?\s*\$?[\d,]|'
+        r'^\s*(?:\$\d+(?:\.\d{2})?|\d+(?:\.\d{2})?\$?)\s*$|'
+        r'parts?\s*\$?\s*\d',
+        re.IGNORECASE
+    )
+    
+    # Characters that rule out a technician-name line: digits, price/phone
+    # punctuation and Hebrew letters
+    NON_NAME_CHAR_PATTERN = re.compile(r'[\d\$\+\(\)\[\]\u0590-\u05FF]')
+    
+    # Words that are never (part of) a technician name
+    TECHNICIAN_IGNORE_WORDS = frozenset({'alpha', 'job', 'parts', 'part', 'total', 'cash', 'check',
+                                         'cc', 'zelle', 'credit', 'card', 'hlo', 'hello', 'hi'})
+    
+    # Any digit (quick reject for text that cannot contain a price)
+    DIGIT_PATTERN = re.compile(r'\d')
+    
     # Alpha job marker
     ALPHA_JOB_PATTERN = re.compile(r'alpha\s*job', re.IGNORECASE)
     
@@ -98,6 +154,41 @@ class MessageParser:
     PHONE_LABEL_PATTERN = re.compile(r'ph(?:one)?\s*:\s*(.+)', re.IGNORECASE)
     DESC_LABEL_PATTERN = re.compile(r'desc(?:ription)?\s*:\s*(.+)', re.IGNORECASE)
     DATE_LABEL_PATTERN = re.compile(r'date\s*:\s*(.+)', re.IGNORECASE)
+    # Value of a date: label (1/5/26, 1-5-2026, 1.5.26), month first
+    DATE_VALUE_PATTERN = re.compile(r'^(\d{1,2})([/\-.])(\d{1,2})\2(\d{2}|\d{4})$', re.ASCII)
+    
+    # Description words that end an address line (lowercase, see _clean_address)
+    ADDRESS_SEPARATORS = ('lock change', 'locks change', 'house lockout', 'alpha job', 'appointment')
+    
+    # WhatsApp-style "[4:28 PM, 12/30/2025] Oren: " prefixes (time first / date first)
+    TIMESTAMP_PREFIX_PATTERNS = (
+        re.compile(r'^\[?\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM)?,?\s*\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4}\]\s*[^:]*:\s*', re.IGNORECASE),
+        re.compile(r'^\[?\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4},?\s*\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM)?\]\s*[^:]*:\s*', re.IGNORECASE),
+    )
+    # "[12/7/25, 3:39:38 PM] Oren: <content>" (approximate timestamp match)
+    TIMESTAMP_SENDER_PATTERN = re.compile(r'^\[?[\d/\-\.:,\s]+(?:PM|AM)?\]\s*[^:]+:\s*(.+)', re.IGNORECASE)
+    # "1.1.2025 <content>"
+    DATE_PREFIX_PATTERN = re.compile(r'^\d{1,2}[\./\-]\d{1,2}[\./\-]\d{2,4}\s+(.+)')
+    # "[12/7/25" style date at line start
+    DATE_LINE_PATTERN = re.compile(r'^\[?\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}')
+    # Street number followed by a word ("202 Hartman")
+    STREET_NUMBER_PATTERN = re.compile(r'^\d+\s+[A-Za-z]+')
+    # Number with a common street suffix somewhere after it
+    STREET_SUFFIX_PATTERN = re.compile(r'\d+.*(?:St|Ave|Rd|Blvd|Dr|Ln|Way|Pl|Ct|Broadway)', re.IGNORECASE)
+    # Number followed by "$" ("300$"), i.e. a price rather than an address
+    NUMBER_PRICE_PATTERN = re.compile(r'^\d+\s*\$')
+    
+    # Street suffix word in a short line (rules the line out as a tech amount)
+    STREET_WORD_PATTERN = re.compile(
+        r'\b(?:st|street|ave|avenue|rd|road|blvd|dr|drive|ln|lane|way|pl|place|ct|court|park)\b'
+    )
+    
+    # Job-start markers used by parse_multiple_jobs
+    JOB_START_TIMESTAMP_PATTERN = re.compile(r'^\[?\d{1,2}:\d{2}')
+    JOB_START_ADDRESS_PATTERN = re.compile(
+        r'^\d+[A-Za-z]?\s+[\w\s]+(?:st|street|ave|avenue|rd|road|blvd|dr|drive|ln|lane|way|pl|place|ct|court)',
+        re.IGNORECASE
+    )
     
     # US Address pattern (simplified)
     ADDRESS_PATTERN = re.compile(
@@ -105,16 +196,72 @@ class MessageParser:
         re.IGNORECASE
     )
     
-    def parse_single_job(self, text: str) -> Optional[ParsedJob]:
+    # State + zip tail of ADDRESS_PATTERN, a cheap necessary condition for it
+    STATE_ZIP_PATTERN = re.compile(r'(?:NY|New York|NJ|New Jersey|CT|Connecticut)\s*\d{5}', re.IGNORECASE)
+    # Characters that can never appear inside an ADDRESS_PATTERN match
+    ADDRESS_BREAK_PATTERN = re.compile(r'[^\w\s.,]')
+    # Longest stretch of text before a state + zip searched for a standard address
+    ADDRESS_WINDOW = 120
+    
+    # Minimum number of job blocks before parse_multiple_jobs uses a process pool
+    PARALLEL_MIN_BLOCKS = 8
+    
+    # ParsedJob fields that can be skipped through the fields= argument
+    OPTIONAL_FIELDS = frozenset({'description', 'phone', 'job_date', 'technician_name'})
+    
+    def parse_single_job(self, text: str, fields: Optional[Iterable[str]] = None) -> Optional[ParsedJob]:
         """
         Parse a single job message.
         
+        Results are memoized by parser class and message text, so re-parsing
+        the same pasted block (e.g. on a Streamlit rerun) is free. Parsers must
+        therefore keep no per-instance state that affects the result.
+        
         Args:
             text: The message text containing job closure info
+            fields: ParsedJob fields to extract. description, phone, job_date
+                and technician_name are only extracted when listed (otherwise
+                left at their defaults); None extracts everything
             
         Returns:
             ParsedJob if successful, None if parsing fails
+            
+        Raises:
+            ValueError: If fields names anything outside OPTIONAL_FIELDS
+        """
+        return _parse_single_job_cached(type(self), text, self._normalize_fields(fields))
+    
+    @classmethod
+    def _normalize_fields(cls, fields: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+        """Turn a fields= argument into a hashable cache key, rejecting unknown names."""
+        if fields is None:
+            return None
+        fields = frozenset(fields)
+        unknown = fields - cls.OPTIONAL_FIELDS
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(sorted(unknown))} "
+                f"(expected any of {', '.join(sorted(cls.OPTIONAL_FIELDS))})"
+            )
+        return fields
+    
+    @staticmethod
+    def cache_info() -> Any:
+        """
+        Hit/miss statistics of the parse_single_job result cache.
+        
+        Returns:
+            Named tuple of (hits, misses, maxsize, currsize), as from lru_cache
         """
+        return _parse_single_job_cached.cache_info()
+    
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop all memoized parse_single_job results."""
+        _parse_single_job_cached.cache_clear()
+    
+    def _parse_single_job(self, text: str, fields: Optional[FrozenSet[str]] = None) -> Optional[ParsedJob]:
+        """Uncached implementation of parse_single_job."""
         lines = text.strip().split('\n')
         if not lines:
             return None
@@ -125,7 +272,7 @@ class MessageParser:
             return None
         
         # Find total amount and payment method
-        total, payment_method = self._extract_total(text)
+        total, payment_method = self._extract_total(text, lines)
         if total is None or total == 0:
             return None
         
@@ -148,20 +295,24 @@ class MessageParser:
         # Find parts
         parts = self._extract_parts(text)
         
+        # Fields below are optional; skipped ones keep their ParsedJob defaults
+        def wanted(field: str) -> bool:
+            return fields is None or field in fields
+        
         # Find phone
-        phone = self._extract_phone(text)
+        phone = self._extract_phone(text) if wanted('phone') else ""
         
         # Find job date
-        job_date = self._extract_date(text)
+        job_date = self._extract_date(text) if wanted('job_date') else None
         
         # Find description (lines between address and phone/alpha job)
-        description = self._extract_description(text, address, phone)
+        description = self._extract_description(text, lines, address, phone) if wanted('description') else ""
         
         # Find technician name (last non-empty line that's not pricing info)
-        technician_name = self._extract_technician_name(text)
+        technician_name = self._extract_technician_name(lines) if wanted('technician_name') else ""
         
         # Find fixed tech amount override (e.g., "120$Tech")
-        tech_amount = self._extract_tech_amount(text)
+        tech_amount = self._extract_tech_amount(lines)
         
         return ParsedJob(
             address=address,
@@ -178,7 +329,8 @@ class MessageParser:
             tech_amount=tech_amount
         )
     
-    def parse_multiple_jobs(self, text: str) -> List[ParsedJob]:
+    def parse_multiple_jobs(self, text: str, max_workers: Optional[int] = None,
+                            fields: Optional[Iterable[str]] = None) -> List[ParsedJob]:
         """
         Parse multiple job messages from a single text block.
         Jobs are separated by identifying technician names at the end of each job.
@@ -190,54 +342,78 @@ class MessageParser:
         
         Args:
             text: Text containing multiple job messages
+            max_workers: When > 1 and there are at least PARALLEL_MIN_BLOCKS
+                blocks, parse blocks in a process pool of this size
+            fields: Passed to parse_single_job for every block
             
         Returns:
             List of ParsedJob objects
         """
-        jobs = []
-        lines = text.strip().split('\n')
+        fields = self._normalize_fields(fields)
+        if not (max_workers and max_workers > 1):
+            return list(self.iter_jobs(text, fields))
+        
+        # Blocks are independent, so large pastes can fan out
+        job_blocks = list(self._iter_job_blocks(text))
+        if len(job_blocks) >= self.PARALLEL_MIN_BLOCKS:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_parse_single_job_worker, repeat(type(self)), job_blocks,
+                                            repeat(fields), chunksize=4))
+        else:
+            results = [self.parse_single_job(block, fields) for block in job_blocks]
+        
+        return [job for job in results if job]
+    
+    def iter_jobs(self, text: str, fields: Optional[Iterable[str]] = None) -> Iterator[ParsedJob]:
+        """
+        Lazily parse multiple job messages (see parse_multiple_jobs).
+        Each block is parsed as soon as its end is found, so callers that
+        consume jobs one at a time never hold every block in memory.
+        """
+        fields = self._normalize_fields(fields)
+        for block in self._iter_job_blocks(text):
+            job = self.parse_single_job(block, fields)
+            if job:
+                yield job
+    
+    def _iter_job_blocks(self, text: str) -> Iterator[str]:
+        """Yield the non-blank job blocks of text, in order."""
+        # Every price format needs a digit: skip pastes that cannot hold a job
+        if not self.DIGIT_PATTERN.search(text):
+            return
+        
+        text = text.strip()
+        lines = text.split('\n')
+        pricing_lines = self._find_pricing_lines(text)
         
-        # Words to ignore (not technician names)
-        ignore_words = {'alpha', 'job', 'parts', 'part', 'total', 'cash', 'check', 
-                        'cc', 'zelle', 'credit', 'card', 'hlo', 'hello', 'hi'}
+        ignore_words = self.TECHNICIAN_IGNORE_WORDS
         
         def is_technician_name(line: str) -> bool:
             """Check if a line is a technician name (1-2 words, only letters)"""
-            line_stripped = line.strip()
-            line_lower = line_stripped.lower()
-            
-            if not line_stripped:
+            # Check for 1-2 words, only (ASCII) letters. str.isalpha also rules out
+            # numbers, special characters ($, +, (, [, @ ...) and Hebrew, so no
+            # per-character regex scans are needed.
+            words = line.split()
+            if not words or len(words) > 2:
                 return False
             
-            # Must not contain numbers
-            if re.search(r'\d', line_stripped):
-                return False
-            
-            # Must not contain special characters
-            if re.search(r'[\$\+\(\)\[\]\@\#\%\&\*]', line_stripped):
-                return False
-            
-            # Skip Hebrew
-            if re.search(r'[\u0590-\u05FF]', line_stripped):
+            if not all(w.isascii() and w.isalpha() for w in words):
                 return False
             
             # Skip "alpha job" pattern
-            if re.match(r'^alpha\s*job$', line_lower):
-                return False
-            
-            # Check for 1-2 words, only letters
-            words = line_stripped.split()
-            if len(words) > 2:
-                return False
-            
-            # All words must be only letters
-            if not all(re.match(r'^[a-zA-Z]+$', w) for w in words):
+            line_lower = line.strip().lower()
+            if line_lower.startswith('alpha') and self.ALPHA_JOB_PATTERN.fullmatch(line_lower):
                 return False
             
             # Filter out ignored words
             name_words = [w for w in words if w.lower() not in ignore_words]
             return len(name_words) > 0
         
+        # Bound once: is_new_job_start runs for every candidate block end
+        match_timestamp = self.JOB_START_TIMESTAMP_PATTERN.match
+        search_address = self.JOB_START_ADDRESS_PATTERN.search
+        match_phone = self.PHONE_PATTERN.match
+        
         def is_new_job_start(line: str) -> bool:
             """Check if a line looks like the start of a new job"""
             line_stripped = line.strip()
@@ -247,42 +423,26 @@ class MessageParser:
                 return False
             
             # Timestamp pattern [9:38 PM, 1/7/2026] or similar
-            if re.match(r'^\[?\d{1,2}:\d{2}', line_stripped):
+            if match_timestamp(line_stripped):
                 return True
             
             # Address pattern (number + street)
-            if re.search(r'^\d+[A-Za-z]?\s+[\w\s]+(?:st|street|ave|avenue|rd|road|blvd|dr|drive|ln|lane|way|pl|place|ct|court)', line_lower, re.IGNORECASE):
+            if search_address(line_lower):
                 return True
             
             # Phone number
-            if self.PHONE_PATTERN.match(line_stripped):
+            if match_phone(line_stripped):
                 return True
             
             return False
         
         # Split into job blocks
-        job_blocks = []
         current_block = []
         found_pricing_in_block = False
         
         for i, line in enumerate(lines):
-            line_stripped = line.strip()
-            line_lower = line_stripped.lower()
-            
             # Check if this line has pricing info
-            has_pricing = (self.TOTAL_CASH_PATTERN.search(line) or
-                          self.TOTAL_CHECK_PATTERN.search(line) or
-                          self.TOTAL_CC_PATTERN.search(line) or
-                          self.RUN_CC_PATTERN.search(line) or
-                          self.TOTAL_ZELLE_PATTERN.search(line) or
-                          self.PRICE_IN_CASH_PATTERN.search(line) or
-                          self.PRICE_IN_CHECK_PATTERN.search(line) or
-                          self.PRICE_IN_CC_PATTERN.search(line) or
-                          self.PRICE_IN_ZELLE_PATTERN.search(line) or
-                          self.STANDALONE_PRICE_PATTERN.search(line) or
-                          self.PARTS_PATTERN.search(line))
-            
-            if has_pricing:
+            if i in pricing_lines:
                 found_pricing_in_block = True
             
             current_block.append(line)
@@ -297,22 +457,38 @@ class MessageParser:
                 
                 if next_line_idx >= len(lines) or is_new_job_start(lines[next_line_idx]):
                     # This is the end of a job
-                    job_blocks.append('\n'.join(current_block))
+                    block = '\n'.join(current_block)
+                    if block.strip():
+                        yield block
                     current_block = []
                     found_pricing_in_block = False
         
         # Don't forget the last block
         if current_block:
-            job_blocks.append('\n'.join(current_block))
-        
-        # Parse each job block
-        for block in job_blocks:
+            block = '\n'.join(current_block)
             if block.strip():
-                job = self.parse_single_job(block)
-                if job:
-                    jobs.append(job)
-        
-        return jobs
+                yield block
+        
+    def _find_pricing_lines(self, text: str) -> Set[int]:
+        """Indexes of the lines of text that carry pricing info, from a single regex scan."""
+        pricing_lines = set()
+        line_idx = 0
+        pos = 0
+        for match in self.PRICING_PROBE_PATTERN.finditer(text):
+            line_idx += text.count('\n', pos, match.start())
+            pos = match.start()
+            pricing_lines.add(line_idx)
+        return pricing_lines
+    
+    @staticmethod
+    def _is_timestamp_prefix(line: str) -> bool:
+        """Cheap head-character test for a timestamp line (digits then ':', '/' or '-')."""
+        i = 1 if line.startswith('[') else 0
+        if len(line) <= i + 1 or not line[i].isdecimal():
+            return False
+        if line[i + 1].isdecimal():
+            i += 1
+        return len(line) > i + 1 and line[i + 1] in ':/-'
     
     def _clean_address(self, address: str) -> str:
         """Clean address string by removing description parts and timestamp prefixes."""
@@ -320,12 +496,8 @@ class MessageParser:
             return address
         
         # Remove WhatsApp-style timestamp prefixes like "[4:28 PM, 12/30/2025] Oren:"
-        timestamp_patterns = [
-            r'^\[?\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM)?,?\s*\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4}\]\s*[^:]*:\s*',  # Time first
-            r'^\[?\d{1,2}[/\-\.]\d{1,2}[/\-\.]\d{2,4},?\s*\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM)?\]\s*[^:]*:\s*',  # Date first
-        ]
-        for pattern in timestamp_patterns:
-            address = re.sub(pattern, '', address, flags=re.IGNORECASE)
+        for pattern in self.TIMESTAMP_PREFIX_PATTERNS:
+            address = pattern.sub('', address)
         address = address.strip()
         
         # Stop at phone number
@@ -336,10 +508,10 @@ class MessageParser:
         # Heuristic: If we have a zip code, limit to shortly after zip (to include apartment info)
         # But if there are description words, cut before them.
         
-        separators = ["Lock change", "Locks change", "House lockout", "Alpha job", "Alpha Job", "Appointment"]
+        address_lower = address.lower()
         split_idx = len(address)
-        for sep in separators:
-            idx = address.lower().find(sep.lower())
+        for sep in self.ADDRESS_SEPARATORS:
+            idx = address_lower.find(sep)
             if idx != -1 and idx < split_idx:
                 split_idx = idx
         
@@ -359,25 +531,24 @@ class MessageParser:
         for line in lines:
              # pattern to capture content after timestamp and sender name
              # Matches: [date] Name: Content (approximate timestamp match)
-             timestamp_match = re.match(r'^\[?[\d/\-\.:,\s]+(?:PM|AM)?\]\s*[^:]+:\s*(.+)', line, re.IGNORECASE)
+             timestamp_match = self.TIMESTAMP_SENDER_PATTERN.match(line)
              if timestamp_match:
                  content = timestamp_match.group(1).strip()
                  # Check if content starts with number and looks like address
-                 if re.match(r'^\d+\s+[A-Za-z]+', content) and len(content) > 10 and not self.PHONE_PATTERN.match(content):
+                 if self.STREET_NUMBER_PATTERN.match(content) and len(content) > 10 and not self.PHONE_PATTERN.match(content):
                      return self._clean_address(content)
 
         # Check for lines starting with date (e.g. 1.1.2025 Address)
-        date_start_pattern = re.compile(r'^\d{1,2}[\./\-]\d{1,2}[\./\-]\d{2,4}\s+(.+)')
         for line in lines:
-            match = date_start_pattern.match(line.strip())
+            match = self.DATE_PREFIX_PATTERN.match(line.strip())
             if match:
                 content = match.group(1).strip()
                 # Content should start with number and looks like address
-                if re.match(r'^\d+\s+[A-Za-z]+', content) and len(content) > 10 and not self.PHONE_PATTERN.match(content):
+                if self.STREET_NUMBER_PATTERN.match(content) and len(content) > 10 and not self.PHONE_PATTERN.match(content):
                      return self._clean_address(content)
 
         # Then try regex pattern for standard address format
-        match = self.ADDRESS_PATTERN.search(text)
+        match = self._search_standard_address(text)
         if match:
              # Standard pattern usually grabs just the address, but good to be safe
             return self._clean_address(match.group(0).strip())
@@ -386,7 +557,7 @@ class MessageParser:
         # Fallback: first line that looks like an address (contains numbers and common street suffixes)
         for line in lines:
             line = line.strip()
-            if re.search(r'\d+.*(?:St|Ave|Rd|Blvd|Dr|Ln|Way|Pl|Ct|Broadway)', line, re.IGNORECASE):
+            if self.STREET_SUFFIX_PATTERN.search(line):
                 # Could be multi-line address, check next line for city/state
                 return self._clean_address(line)
         
@@ -394,96 +565,83 @@ class MessageParser:
         for line in lines:
             line = line.strip()
             # Skip timestamp lines like [12/7/25, 3:39:38 PM]
-            if re.match(r'^\[?\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}', line):
+            if self.DATE_LINE_PATTERN.match(line):
                 continue
             # Match lines starting with street number followed by text (e.g., "202 Hartman tarrytown")
-            if re.match(r'^\d+\s+[A-Za-z]+', line) and len(line) > 10:
+            if self.STREET_NUMBER_PATTERN.match(line) and len(line) > 10:
                 # Make sure it's not just a price or phone
-                if not self.PHONE_PATTERN.match(line) and not re.match(r'^\d+\s*\$', line):
+                if not self.PHONE_PATTERN.match(line) and not self.NUMBER_PRICE_PATTERN.match(line):
                     return self._clean_address(line)
         
         # Last resort: first non-empty line that's not a timestamp or alpha job
+        # ("alpha" literal check first: no regex call when the marker is absent)
+        has_alpha_marker = 'alpha' in text.lower()
         for line in lines:
             line_stripped = line.strip()
-            if line_stripped and not self.ALPHA_JOB_PATTERN.search(line):
+            if line_stripped and not (has_alpha_marker and self.ALPHA_JOB_PATTERN.search(line)):
                 # Skip timestamp lines
-                if re.match(r'^\[?\d{1,2}[:/\-]', line_stripped):
+                if self._is_timestamp_prefix(line_stripped):
                     continue
                 return self._clean_address(line_stripped)
         
         return None
     
-    def _extract_total(self, text: str) -> Tuple[Optional[float], str]:
+    def _search_standard_address(self, text: str) -> Optional[re.Match]:
+        """
+        Search ADDRESS_PATTERN only in short windows around a state + zip.
+        
+        Every match ends in a state + zip and holds only word characters,
+        whitespace, '.' and ','. On long text the overlapping [\\w\\s]+ runs in
+        ADDRESS_PATTERN backtrack polynomially, so the start is searched for in
+        at most ADDRESS_WINDOW characters before the first reachable zip
+        (after the last character that cannot be part of an address). As with
+        an unbounded search, the match then runs greedily to the last state +
+        zip it can reach, here within ADDRESS_WINDOW characters after that zip.
+        """
+        for zip_match in self.STATE_ZIP_PATTERN.finditer(text):
+            start = max(0, zip_match.start() - self.ADDRESS_WINDOW)
+            for stop in self.ADDRESS_BREAK_PATTERN.finditer(text, start, zip_match.start()):
+                start = stop.end()
+            match = self.ADDRESS_PATTERN.search(text, start, zip_match.end())
+            if match:
+                end = min(len(text), zip_match.end() + self.ADDRESS_WINDOW)
+                stop = self.ADDRESS_BREAK_PATTERN.search(text, zip_match.end(), end)
+                return self.ADDRESS_PATTERN.match(text, match.start(), stop.start() if stop else end)
+        return None
+    
+    def _extract_total(self, text: str, lines: List[str]) -> Tuple[Optional[float], str]:
         """Extract total amount and payment method."""
-        # Helper to clean price string (remove commas)
-        def clean_price(p: str) -> float:
-            return float(p.replace(',', ''))
-        
         # First, check for split payment (both cash and credit in the same job)
         split_result = self._extract_split_payment(text)
         if split_result:
             # Returns (total, 'split', cash_amount, cc_amount, check_amount)
             return split_result[0], 'split'
         
-        # Check for "Total cash XXX"
-        match = self.TOTAL_CASH_PATTERN.search(text)
-        if match:
-            return clean_price(match.group(1)), 'cash'
-        
-        # Check for "Total check XXX"
-        match = self.TOTAL_CHECK_PATTERN.search(text)
-        if match:
-            return clean_price(match.group(1)), 'check'
-        
-        # Check for "Total cc/credit XXX"
-        match = self.TOTAL_CC_PATTERN.search(text)
-        if match:
-            return clean_price(match.group(1)), 'cc'
-        
-        # Check for "Total XXX Zelle" format
-        match = self.TOTAL_ZELLE_PATTERN.search(text)
-        if match:
-            return float(match.group(1)), 'check'  # Zelle is treated as check
-        
-        # Check for "$325 parts $10" format (price with parts on same line)
-        match = self.PRICE_WITH_PARTS_PATTERN.search(text)
-        if match:
-            return float(match.group(1)), 'cash'  # Parts will be extracted separately
-        
-        # Check for "XXX$ in cash" or "XXX in cash" format
-        match = self.PRICE_IN_CASH_PATTERN.search(text)
-        if match:
-            return float(match.group(1)), 'cash'
-        
-        # Check for "XXX$ in check" format
-        match = self.PRICE_IN_CHECK_PATTERN.search(text)
-        if match:
-            return float(match.group(1)), 'check'
-        
-        # Check for "XXX$ in cc" format
-        match = self.PRICE_IN_CC_PATTERN.search(text)
-        if match:
-            return float(match.group(1)), 'cc'
-        
-        # Check for "XXX zelle" or "XXX$ zelle" format (e.g., "850 zelle to oren")
-        match = self.PRICE_IN_ZELLE_PATTERN.search(text)
-        if match:
-            return float(match.group(1)), 'check'  # Zelle is treated as check
-        
-        # Check for "run cc XXX$" or just "cc XXX$" format (e.g., "Total cc Oren run cc 486.60$")
-        match = self.RUN_CC_PATTERN.search(text)
-        if match:
-            price_str = match.group(1).replace(',', '')
-            return float(price_str), 'cc'
+        # Try each total format in priority order; a pattern is only searched
+        # when one of its keywords occurs in the text at all
+        text_folded = text.casefold()
+        for pattern, payment_method, keywords in self.TOTAL_PATTERNS:
+            if not any(keyword in text_folded for keyword in keywords):
+                continue
+            match = pattern.search(text)
+            if match:
+                return float(match.group(1).replace(',', '')), payment_method
         
         # Check for standalone price ($446 or 446$)
-        match = self.STANDALONE_PRICE_PATTERN.search(text)
-        if match:
-            price = match.group(1) or match.group(2)
-            return float(price), 'cash'  # Default to cash
+        price = self._find_standalone_price(lines)
+        if price is not None:
+            return price, 'cash'  # Default to cash
         
         return None, 'cash'
     
+    def _find_standalone_price(self, lines: List[str]) -> Optional[float]:
+        """Return the first price that sits alone on its line ($446, 446$, 446)."""
+        for line in lines:
+            match = self.STANDALONE_PRICE_LINE_PATTERN.match(line)
+            if match:
+                return float(match.group(1) or match.group(2))
+        return None
+    
     def _extract_split_payment(self, text: str) -> Optional[Tuple[float, float, float, float]]:
         """
         Extract split payment amounts when job has multiple payment methods.
@@ -559,50 +717,47 @@ class MessageParser:
         match = self.DATE_LABEL_PATTERN.search(text)
         if match:
             date_str = match.group(1).strip()
-            # Try various date formats
-            # Format: M/D/YY or MM/DD/YY or M/D/YYYY
-            date_patterns = [
-                (r'^(\d{1,2})/(\d{1,2})/(\d{2})$', '%m/%d/%y'),      # 1/5/26 -> Jan 5, 2026
-                (r'^(\d{1,2})/(\d{1,2})/(\d{4})$', '%m/%d/%Y'),      # 1/5/2026
-                (r'^(\d{1,2})-(\d{1,2})-(\d{2})$', '%m-%d-%y'),      # 1-5-26
-                (r'^(\d{1,2})-(\d{1,2})-(\d{4})$', '%m-%d-%Y'),      # 1-5-2026
-                (r'^(\d{1,2})\.(\d{1,2})\.(\d{2})$', '%m.%d.%y'),    # 1.5.26
-                (r'^(\d{1,2})\.(\d{1,2})\.(\d{4})$', '%m.%d.%Y'),    # 1.5.2026
-            ]
-            
-            from datetime import datetime
-            for pattern, fmt in date_patterns:
-                if re.match(pattern, date_str):
-                    try:
-                        return datetime.strptime(date_str, fmt).date()
-                    except ValueError:
-                        continue
+            # M/D/YY, MM/DD/YYYY, 1-5-26, 1.5.2026 ... (same separator twice)
+            date_match = self.DATE_VALUE_PATTERN.match(date_str)
+            if date_match:
+                month, _, day, year_str = date_match.groups()
+                year = int(year_str)
+                if len(year_str) == 2:
+                    # Same pivot as strptime's %y: 00-68 -> 20xx, 69-99 -> 19xx
+                    year += 2000 if year < 69 else 1900
+                try:
+                    return date(year, int(month), int(day))
+                except ValueError:
+                    pass
         
         return None
     
-    def _extract_description(self, text: str, address: str, phone: str) -> str:
+    def _extract_description(self, text: str, lines: List[str], address: str, phone: str) -> str:
         """Extract job description (text between address and phone/alpha job)."""
         # First check for labeled format (Desc: or Description:)
         match = self.DESC_LABEL_PATTERN.search(text)
         if match:
             return match.group(1).strip()
         
-        lines = text.split('\n')
         description_lines = []
         started = False
+        has_alpha_marker = 'alpha' in text.lower()
         
         for line in lines:
+            if len(description_lines) == 3:  # Max 3 lines
+                break
+            
             line_stripped = line.strip()
             
             # Skip empty lines at the start
             if not started and not line_stripped:
                 continue
             
-            # Start after address line
-            if address and address in line:
+            # Start after address line (one find both tests and locates it)
+            idx = line.find(address) if address else -1
+            if idx != -1:
                 started = True
                 # Check if there is description on the same line as address
-                idx = line.find(address)
                 remainder = line[idx + len(address):].strip()
                 if remainder:
                     # Clean remainder from potential date or phone
@@ -613,7 +768,7 @@ class MessageParser:
                         remainder = remainder[:phone_match.start()].strip()
                     
                     # Also stop at "Alpha job" if it's there
-                    alpha_match = self.ALPHA_JOB_PATTERN.search(remainder)
+                    alpha_match = has_alpha_marker and self.ALPHA_JOB_PATTERN.search(remainder)
                     if alpha_match:
                         remainder = remainder[:alpha_match.start()].strip()
 
@@ -621,28 +776,23 @@ class MessageParser:
                         description_lines.append(remainder)
                 continue
             
-            if started:
+            # Blank lines can never match a stop condition, so skip the scan
+            if started and line_stripped:
                 # Stop at phone, alpha job, or price
-                if (self.PHONE_PATTERN.search(line) or 
-                    self.ALPHA_JOB_PATTERN.search(line) or
-                    self.TOTAL_CASH_PATTERN.search(line) or
-                    self.TOTAL_CHECK_PATTERN.search(line) or
-                    self.STANDALONE_PRICE_PATTERN.search(line) or
-                    self.PARTS_PATTERN.search(line)):
+                if self.DESCRIPTION_STOP_PATTERN.search(line):
                     break
                 
-                if line_stripped:
-                    description_lines.append(line_stripped)
+                description_lines.append(line_stripped)
         
-        return ' | '.join(description_lines[:3])  # Max 3 lines
+        return ' | '.join(description_lines)
     
-    def _extract_tech_amount(self, text: str) -> Optional[float]:
+    def _extract_tech_amount(self, lines: List[str]) -> Optional[float]:
         """
         Extract fixed technician amount from the message.
         Matches patterns like: "120$Tech", "Tech 120", "120 for tech", "tech:120"
         When present, this overrides the percentage-based commission.
         """
-        for line in text.strip().split('\n'):
+        for line in lines:
             line_stripped = line.strip()
             if not line_stripped:
                 continue
@@ -657,7 +807,7 @@ class MessageParser:
                 continue
             
             # Skip lines that look like addresses (contain street suffixes)
-            if re.search(r'\b(?:st|street|ave|avenue|rd|road|blvd|dr|drive|ln|lane|way|pl|place|ct|court|park)\b', line_lower):
+            if self.STREET_WORD_PATTERN.search(line_lower):
                 continue
             
             match = self.TECH_AMOUNT_PATTERN.search(line_stripped)
@@ -669,7 +819,7 @@ class MessageParser:
         
         return None
     
-    def _extract_technician_name(self, text: str) -> str:
+    def _extract_technician_name(self, lines: List[str]) -> str:
         """
         Extract technician name from the message.
         The technician name is always the last word(s) in the message.
@@ -677,15 +827,9 @@ class MessageParser:
         
         We ignore irrelevant words like "Alpha", "job", etc.
         """
-        lines = text.strip().split('\n')
-        
-        # Words to ignore (not technician names)
-        ignore_words = {'alpha', 'job', 'parts', 'part', 'total', 'cash', 'check', 
-                        'cc', 'zelle', 'credit', 'card', 'hlo', 'hello', 'hi'}
+        ignore_words = self.TECHNICIAN_IGNORE_WORDS
         
         # Search from the end of the message for the technician name
-        potential_name_lines = []
-        
         for line in reversed(lines):
             line_stripped = line.strip()
             line_lower = line_stripped.lower()
@@ -694,16 +838,9 @@ class MessageParser:
             if not line_stripped:
                 continue
             
-            # Skip if it contains numbers (addresses, phones, prices, dates)
-            if re.search(r'\d', line_stripped):
-                continue
-            
-            # Skip if it contains special characters (prices, etc.)
-            if re.search(r'[\$\+\(\)\[\]]', line_stripped):
-                continue
-            
-            # Skip lines with Hebrew characters
-            if re.search(r'[\u0590-\u05FF]', line_stripped):
+            # Skip if it contains numbers (addresses, phones, prices, dates),
+            # special characters (prices, etc.) or Hebrew characters
+            if self.NON_NAME_CHAR_PATTERN.search(line_stripped):
                 continue
             
             # Skip ignored words
@@ -711,12 +848,12 @@ class MessageParser:
                 continue
             
             # Skip "alpha job" pattern
-            if re.match(r'^alpha\s*job$', line_lower):
+            if line_lower.startswith('alpha') and self.ALPHA_JOB_PATTERN.fullmatch(line_lower):
                 continue
             
             # Check if this is a valid name (1-2 words, only letters)
             words = line_stripped.split()
-            if len(words) <= 2 and all(re.match(r'^[a-zA-Z]+$', w) for w in words):
+            if len(words) <= 2 and all(w.isascii() and w.isalpha() for w in words):
                 # Filter out ignored words from the name
                 name_words = [w for w in words if w.lower() not in ignore_words]
                 if name_words:
@@ -731,6 +868,29 @@ class MessageParser:
         return ""
 
 
+# Shared parser for the module-level helpers (MessageParser holds no per-instance state)
+_PARSER = MessageParser()
+
+
+@lru_cache(maxsize=None)
+def _parser_for(parser_cls: type) -> MessageParser:
+    """Shared instance of parser_cls, so subclass _extract_* overrides are honoured."""
+    return _PARSER if parser_cls is MessageParser else parser_cls()
+
+
+@lru_cache(maxsize=4096)
+def _parse_single_job_cached(parser_cls: type, text: str,
+                             fields: Optional[FrozenSet[str]] = None) -> Optional[ParsedJob]:
+    """Memoized parse_single_job, keyed by parser class, block text and requested fields."""
+    return _parser_for(parser_cls)._parse_single_job(text, fields)
+
+
+def _parse_single_job_worker(parser_cls: type, text: str,
+                             fields: Optional[FrozenSet[str]] = None) -> Optional[ParsedJob]:
+    """Process-pool entry point for parse_multiple_jobs (must be module-level to pickle)."""
+    return _parse_single_job_cached(parser_cls, text, fields)
+
+
 def parse_messages(text: str) -> List[ParsedJob]:
     """
     Convenience function to parse job messages.
@@ -741,5 +901,4 @@ def parse_messages(text: str) -> List[ParsedJob]:
     Returns:
         List of ParsedJob objects
     """
-    parser = MessageParser()
-    return parser.parse_multiple_jobs(text)
+    return _PARSER.parse_multiple_jobs(text)
@@ -7,7 +7,7 @@ from decimal import Decimal
 PaymentMethod = Literal['cash', 'cc', 'check', 'transfer', 'split']
 
 
-@dataclass
+@dataclass(slots=True)
 class Technician:
     """Represents a technician"""
     id: str
@@ -19,7 +19,7 @@ class Technician:
             raise ValueError("Commission rate must be between 0 and 1")
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Represents a single job/service call"""
     address: str
@@ -49,7 +49,7 @@ class Job:
             self.check_amount = self.total
 
 
-@dataclass
+@dataclass(slots=True)
 class JobResult:
     """Result of commission calculation for a job"""
     job: Job
@@ -6,12 +6,38 @@ from pathlib import Path
 
 from openpyxl import Workbook
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 
 from .models import Job, JobResult, Technician
 from .calculator import CommissionCalculator
 from config import COMPANY_NAME, EXCEL_STYLES
 
+# Excel styles (built once; openpyxl copies style values into each workbook)
+_HEADER_FILL = PatternFill(start_color=EXCEL_STYLES['header_bg_color'],
+                           end_color=EXCEL_STYLES['header_bg_color'],
+                           fill_type='solid')
+_SUMMARY_FILL = PatternFill(start_color=EXCEL_STYLES['summary_bg_color'],
+                            end_color=EXCEL_STYLES['summary_bg_color'],
+                            fill_type='solid')
+_HEADER_FONT = Font(name=EXCEL_STYLES['font_name'],
+                    size=EXCEL_STYLES['font_size'],
+                    bold=True)
+_TITLE_FONT = Font(name=EXCEL_STYLES['font_name'],
+                   size=14,
+                   bold=True)
+_SUBTITLE_FONT = Font(size=12, bold=True)
+_BOLD_FONT = Font(bold=True)
+_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_CENTER_ALIGNMENT = Alignment(horizontal='center')
+_RIGHT_ALIGNMENT = Alignment(horizontal='right')
+_COLUMN_WIDTHS = (12, 35, 8, 12, 12, 12, 12, 12, 10, 12, 12)
+
 
 class ReportGenerator:
     """
@@ -35,23 +61,30 @@ class ReportGenerator:
         """
         Convert results to a pandas DataFrame.
         """
-        data = []
-        for r in self.results:
-            data.append({
-                'Date': r.job.job_date.strftime('%d/%m/%Y') if r.job.job_date else '',
-                'Address': r.job.address,
-                '%': 'Custom' if r.job.tech_amount is not None else f"{int(r.job.commission_rate * 100)}%",
-                'Total': f"${r.job.total:,.2f}",
-                'Parts': f"${r.job.parts:,.2f}" if r.job.parts > 0 else '',
-                'Cash': f"${r.job.cash_amount:,.2f}" if r.job.cash_amount > 0 else '',
-                'CC': f"${r.job.cc_amount:,.2f}" if r.job.cc_amount > 0 else '',
-                'Check': f"${r.job.check_amount:,.2f}" if r.job.check_amount > 0 else '',
-                'FEE': f"${r.job.fee:,.2f}" if r.job.fee > 0 else '',
-                'Tech Profit': f"${r.tech_profit:,.2f}",
-                'Balance': f"${r.balance:,.2f}"
-            })
+        if not self.results:
+            return pd.DataFrame()
+        
+        def money(amount: float) -> str:
+            return f"${amount:,.2f}"
+        
+        def money_if_positive(amount: float) -> str:
+            return f"${amount:,.2f}" if amount > 0 else ''
         
-        return pd.DataFrame(data)
+        # Build column lists (not a dict per row) so pandas gets one array per column
+        jobs = [r.job for r in self.results]
+        return pd.DataFrame({
+            'Date': [j.job_date.strftime('%d/%m/%Y') if j.job_date else '' for j in jobs],
+            'Address': [j.address for j in jobs],
+            '%': ['Custom' if j.tech_amount is not None else f"{int(j.commission_rate * 100)}%" for j in jobs],
+            'Total': [money(j.total) for j in jobs],
+            'Parts': [money_if_positive(j.parts) for j in jobs],
+            'Cash': [money_if_positive(j.cash_amount) for j in jobs],
+            'CC': [money_if_positive(j.cc_amount) for j in jobs],
+            'Check': [money_if_positive(j.check_amount) for j in jobs],
+            'FEE': [money_if_positive(j.fee) for j in jobs],
+            'Tech Profit': [money(r.tech_profit) for r in self.results],
+            'Balance': [money(r.balance) for r in self.results],
+        })
     
     def get_summary_row(self) -> dict:
         """Get summary row data."""
@@ -88,32 +121,12 @@ class ReportGenerator:
         ws = wb.active
         ws.title = "Commission Report"
         
-        # Styles
-        header_fill = PatternFill(start_color=EXCEL_STYLES['header_bg_color'],
-                                   end_color=EXCEL_STYLES['header_bg_color'],
-                                   fill_type='solid')
-        summary_fill = PatternFill(start_color=EXCEL_STYLES['summary_bg_color'],
-                                    end_color=EXCEL_STYLES['summary_bg_color'],
-                                    fill_type='solid')
-        header_font = Font(name=EXCEL_STYLES['font_name'], 
-                          size=EXCEL_STYLES['font_size'], 
-                          bold=True)
-        title_font = Font(name=EXCEL_STYLES['font_name'], 
-                         size=14, 
-                         bold=True)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
         # Title section
         ws['A1'] = COMPANY_NAME
-        ws['A1'].font = title_font
+        ws['A1'].font = _TITLE_FONT
         
         ws['A2'] = f"Technician: {self.technician.name}"
-        ws['A2'].font = Font(size=12, bold=True)
+        ws['A2'].font = _SUBTITLE_FONT
         
         start_date, end_date = self.get_date_range()
         if start_date and end_date:
@@ -127,19 +140,21 @@ class ReportGenerator:
         # Headers
         for col_idx, col_name in enumerate(df.columns, 1):
             cell = ws.cell(row=start_row, column=col_idx, value=col_name)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.border = border
-            cell.alignment = Alignment(horizontal='center')
+            cell.fill = _HEADER_FILL
+            cell.font = _HEADER_FONT
+            cell.border = _BORDER
+            cell.alignment = _CENTER_ALIGNMENT
+        
+        # Data rows: append whole rows (below the header), then style the block
+        for row in df.itertuples(index=False, name=None):
+            ws.append(row)
         
-        # Data rows
-        for row_idx, row in df.iterrows():
-            for col_idx, value in enumerate(row, 1):
-                cell = ws.cell(row=start_row + row_idx + 1, column=col_idx, value=value)
-                cell.border = border
+        for row in ws.iter_rows(min_row=start_row + 1, max_row=start_row + len(df)):
+            for col_idx, cell in enumerate(row, 1):
+                cell.border = _BORDER
                 if col_idx >= 4:  # Numeric columns
-                    cell.alignment = Alignment(horizontal='right')
-                    if isinstance(value, (int, float)) and value != '':
+                    cell.alignment = _RIGHT_ALIGNMENT
+                    if isinstance(cell.value, (int, float)):
                         cell.number_format = '$#,##0.00'
         
         # Summary row
@@ -147,18 +162,17 @@ class ReportGenerator:
         summary_data = self.get_summary_row()
         for col_idx, col_name in enumerate(df.columns, 1):
             cell = ws.cell(row=summary_row, column=col_idx, value=summary_data[col_name])
-            cell.fill = summary_fill
-            cell.font = Font(bold=True)
-            cell.border = border
+            cell.fill = _SUMMARY_FILL
+            cell.font = _BOLD_FONT
+            cell.border = _BORDER
             if col_idx >= 4:
-                cell.alignment = Alignment(horizontal='right')
+                cell.alignment = _RIGHT_ALIGNMENT
                 if isinstance(summary_data[col_name], (int, float)):
                     cell.number_format = '$#,##0.00'
         
         # Adjust column widths
-        column_widths = [12, 35, 8, 12, 12, 12, 12, 12, 10, 12, 12]
-        for idx, width in enumerate(column_widths, 1):
-            ws.column_dimensions[chr(64 + idx)].width = width
+        for idx, width in enumerate(_COLUMN_WIDTHS, 1):
+            ws.column_dimensions[get_column_letter(idx)].width = width
         
         # Save
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
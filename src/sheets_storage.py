@@ -1,8 +1,10 @@
 """Google Sheets storage backend for persistent data storage"""
+import copy
+import functools
 import json
 import os
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 import streamlit as st
 
@@ -10,8 +12,11 @@ try:
     import gspread
     from google.oauth2.service_account import Credentials
     GSPREAD_AVAILABLE = True
+    # Raised through a cached worksheet handle whose tab was renamed, deleted or recreated by hand
+    _STALE_WORKSHEET_ERRORS = (gspread.exceptions.WorksheetNotFound, gspread.exceptions.APIError)
 except ImportError:
     GSPREAD_AVAILABLE = False
+    _STALE_WORKSHEET_ERRORS = ()
 
 # Google Sheets configuration
 SCOPES = [
@@ -29,6 +34,43 @@ JOB_HEADERS = [
     'cash_amount', 'cc_amount', 'check_amount', 'tech_amount'
 ]
 
+# Job columns stored as numbers (blank or invalid cells read as 0.0)
+NUMERIC_FIELDS = ('total', 'parts', 'commission_rate', 'cash_amount', 'cc_amount', 'check_amount')
+
+# Cell values (lowercased) that mean True in boolean columns such as is_paid
+_TRUE_VALUES = frozenset({'true', '1', 'yes'})
+
+_RAISE = object()
+
+
+def _retry_stale_worksheet(default: Any = _RAISE):
+    """
+    Retry a GoogleSheetsClient method once with freshly looked-up worksheets.
+    
+    Worksheet handles are cached per client, so a tab renamed, deleted or
+    recreated by hand fails every call made through the old handle. The
+    wrapped method lets those errors through; the cached handles are then
+    dropped and the method runs again. If the retry fails too, the error is
+    printed and a copy of default is returned (or the error is raised when no
+    default is given), matching how the method reports its other failures.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except _STALE_WORKSHEET_ERRORS:
+                self._worksheets.clear()
+            try:
+                return method(self, *args, **kwargs)
+            except _STALE_WORKSHEET_ERRORS as e:
+                if default is _RAISE:
+                    raise
+                print(f"Error in {method.__name__}: {e}")
+                return copy.copy(default)
+        return wrapper
+    return decorator
+
 
 class GoogleSheetsClient:
     """Client for interacting with Google Sheets"""
@@ -36,6 +78,8 @@ class GoogleSheetsClient:
     def __init__(self):
         self.client = None
         self.spreadsheet = None
+        # Worksheet handles, fetched once per client (dropped again if a tab goes stale)
+        self._worksheets: Dict[str, Any] = {}
         self._connect()
     
     def _get_credentials(self) -> Optional[Credentials]:
@@ -90,26 +134,81 @@ class GoogleSheetsClient:
         self.spreadsheet = self.client.open_by_key(SHEET_ID)
     
     def get_worksheet(self, name: str):
-        """Get or create a worksheet by name"""
-        try:
-            return self.spreadsheet.worksheet(name)
-        except gspread.WorksheetNotFound:
-            return self.spreadsheet.add_worksheet(title=name, rows=1000, cols=20)
-
-    def _ensure_jobs_headers(self, worksheet) -> List[str]:
-        """Ensure jobs worksheet has all required columns and return headers."""
-        headers = worksheet.row_values(1)
+        """Get or create a worksheet by name (cached per client)"""
+        worksheet = self._worksheets.get(name)
+        if worksheet is None:
+            try:
+                worksheet = self.spreadsheet.worksheet(name)
+            except gspread.WorksheetNotFound:
+                worksheet = self.spreadsheet.add_worksheet(title=name, rows=1000, cols=20)
+            self._worksheets[name] = worksheet
+        return worksheet
+
+    def _ensure_jobs_headers(self, worksheet, headers: Optional[List[str]] = None) -> List[str]:
+        """
+        Ensure jobs worksheet has all required columns and return headers.
+        
+        Pass headers when row 1 was just read (see _read_header_and_row);
+        otherwise it is read here.
+        """
+        # Never cached: writes place values by column position, and columns
+        # may have been inserted or reordered by hand in the Sheet
+        if headers is None:
+            headers = worksheet.row_values(1)
         if not headers:
-            worksheet.update('A1', [JOB_HEADERS])
-            return JOB_HEADERS.copy()
+            headers = JOB_HEADERS.copy()
+            worksheet.update('A1', [headers])
+            return headers
 
         missing = [h for h in JOB_HEADERS if h not in headers]
         if missing:
-            headers.extend(missing)
+            headers = headers + missing
             worksheet.update('A1', [headers])
 
         return headers
 
+    @staticmethod
+    def _read_header_and_row(worksheet, row_num: int) -> Tuple[List[str], List[Any]]:
+        """
+        Read the header row and one record row in a single values request.
+        
+        Values come back unformatted (numbers and booleans as Python values,
+        not display text) so they can be compared with what is about to be
+        written; dates still come back as text.
+        """
+        header_range, row_range = worksheet.batch_get(
+            ['1:1', f'{row_num}:{row_num}'],
+            value_render_option='UNFORMATTED_VALUE',
+            date_time_render_option='FORMATTED_STRING'
+        )
+        headers = header_range[0] if header_range else []
+        row = row_range[0] if row_range else []
+        return headers, row
+
+    @staticmethod
+    def _find_row(worksheet, record_id: str) -> Optional[int]:
+        """Find the 1-based row of a record by ID, reading only the ID column."""
+        record_id = str(record_id)
+        for row_idx, value in enumerate(worksheet.col_values(1)[1:], start=2):
+            if value == record_id:
+                return row_idx
+        return None
+
+    @staticmethod
+    def _to_cell(value: Any) -> Any:
+        """Convert a job value to what is written to the sheet (bools as 'true'/'false', None as blank)."""
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if value is None:
+            return ''
+        return value
+
+    @staticmethod
+    def _cell_unchanged(value: Any, current: Any) -> bool:
+        """Check whether writing value over an unformatted cell value would change nothing."""
+        to_cell = GoogleSheetsClient._to_cell
+        return to_cell(value) == to_cell(current)
+
     @staticmethod
     def _rowcol_to_a1(row: int, col: int) -> str:
         """Convert 1-based row/col into A1 notation."""
@@ -122,11 +221,14 @@ class GoogleSheetsClient:
     @staticmethod
     def _normalize_job_record(record: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize worksheet values into app-friendly job types."""
-        numeric_fields = ['total', 'parts', 'commission_rate', 'cash_amount', 'cc_amount', 'check_amount']
-
-        for field in numeric_fields:
+        for field in NUMERIC_FIELDS:
             raw = record.get(field, '')
-            if raw in ('', None):
+            # get_all_records already turns numeric cells into int/float
+            if type(raw) is float:
+                continue
+            if type(raw) is int:
+                record[field] = float(raw)
+            elif raw in ('', None):
                 record[field] = 0.0
             else:
                 try:
@@ -144,7 +246,7 @@ class GoogleSheetsClient:
             except (ValueError, TypeError):
                 record['tech_amount'] = None
 
-        record['is_paid'] = str(record.get('is_paid', '')).lower() in ('true', '1', 'yes')
+        record['is_paid'] = str(record.get('is_paid', '')).lower() in _TRUE_VALUES
 
         if record.get('paid_date', '') in ('', None):
             record['paid_date'] = None
@@ -155,6 +257,7 @@ class GoogleSheetsClient:
     
     # ============ JOBS ============
     
+    @_retry_stale_worksheet(default=[])
     def get_all_jobs(self) -> List[Dict[str, Any]]:
         """Get all jobs from the sheet"""
         try:
@@ -162,6 +265,8 @@ class GoogleSheetsClient:
             self._ensure_jobs_headers(worksheet)
             records = worksheet.get_all_records()
             return [self._normalize_job_record(record) for record in records]
+        except _STALE_WORKSHEET_ERRORS:
+            raise
         except Exception as e:
             print(f"Error getting jobs: {e}")
             return []
@@ -171,23 +276,15 @@ class GoogleSheetsClient:
         self.add_jobs([job_data])
         return job_data
     
+    @_retry_stale_worksheet()
     def add_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Add multiple jobs at once"""
         worksheet = self.get_worksheet('jobs')
         headers = self._ensure_jobs_headers(worksheet)
         
         # Prepare all rows
-        rows = []
-        for job_data in jobs:
-            row = []
-            for header in headers:
-                value = job_data.get(header, '')
-                if isinstance(value, bool):
-                    value = str(value).lower()
-                if value is None:
-                    value = ''
-                row.append(value)
-            rows.append(row)
+        to_cell = self._to_cell
+        rows = [[to_cell(job_data.get(header, '')) for header in headers] for job_data in jobs]
         
         # Append all rows at once
         if rows:
@@ -195,6 +292,7 @@ class GoogleSheetsClient:
         
         return jobs
 
+    @_retry_stale_worksheet(default=0)
     def update_jobs(self, updates_by_id: Dict[str, Dict[str, Any]]) -> int:
         """Batch update multiple jobs by ID using a single sheet batch request."""
         if not updates_by_id:
@@ -231,14 +329,9 @@ class GoogleSheetsClient:
                     if not col_idx:
                         continue
 
-                    if isinstance(value, bool):
-                        value = str(value).lower()
-                    if value is None:
-                        value = ''
-
                     batch_payload.append({
                         'range': self._rowcol_to_a1(row_idx, col_idx),
-                        'values': [[value]]
+                        'values': [[self._to_cell(value)]]
                     })
                     touched = True
 
@@ -249,10 +342,13 @@ class GoogleSheetsClient:
                 worksheet.batch_update(batch_payload, value_input_option='USER_ENTERED')
 
             return updated_count
+        except _STALE_WORKSHEET_ERRORS:
+            raise
         except Exception as e:
             print(f"Error batch updating jobs: {e}")
             return 0
     
+    @_retry_stale_worksheet(default=None)
     def update_job(self, job_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a job by ID"""
         try:
@@ -260,18 +356,14 @@ class GoogleSheetsClient:
                 return None
 
             worksheet = self.get_worksheet('jobs')
-            headers = self._ensure_jobs_headers(worksheet)
-            if len(headers) == 0:
-                return None
-
-            cell = worksheet.find(str(job_id), in_column=1)
-            if not cell:
+            row_num = self._find_row(worksheet, job_id)
+            if not row_num:
                 return None
 
-            row_num = cell.row
+            headers, current_row = self._read_header_and_row(worksheet, row_num)
+            headers = self._ensure_jobs_headers(worksheet, headers)
             header_col_index = {header: idx + 1 for idx, header in enumerate(headers)}
 
-            current_row = worksheet.row_values(row_num)
             updated_record: Dict[str, Any] = {}
             for idx, header in enumerate(headers):
                 updated_record[header] = current_row[idx] if idx < len(current_row) else ''
@@ -282,41 +374,88 @@ class GoogleSheetsClient:
                 if not col_idx:
                     continue
 
-                if isinstance(value, bool):
-                    value = str(value).lower()
-                if value is None:
-                    value = ''
-
-                batch_payload.append({
-                    'range': self._rowcol_to_a1(row_num, col_idx),
-                    'values': [[value]]
-                })
+                # Skip cells that already hold this value (e.g. a resubmitted form)
+                unchanged = self._cell_unchanged(value, updated_record[field])
+                value = self._to_cell(value)
+                if not unchanged:
+                    batch_payload.append({
+                        'range': self._rowcol_to_a1(row_num, col_idx),
+                        'values': [[value]]
+                    })
                 updated_record[field] = value
 
             if batch_payload:
                 worksheet.batch_update(batch_payload, value_input_option='USER_ENTERED')
 
             return self._normalize_job_record(updated_record)
+        except _STALE_WORKSHEET_ERRORS:
+            raise
         except Exception as e:
             print(f"Error updating job: {e}")
             return None
     
+    @_retry_stale_worksheet(default=False)
     def delete_job(self, job_id: str) -> bool:
         """Delete a job by ID"""
         worksheet = self.get_worksheet('jobs')
         
         try:
-            cell = worksheet.find(job_id, in_column=1)
-            if cell:
-                worksheet.delete_rows(cell.row)
+            row_num = self._find_row(worksheet, job_id)
+            if row_num:
+                worksheet.delete_rows(row_num)
                 return True
+        except _STALE_WORKSHEET_ERRORS:
+            raise
         except Exception as e:
             print(f"Error deleting job: {e}")
         
         return False
     
+    @_retry_stale_worksheet(default=0)
+    def delete_jobs(self, job_ids: List[str]) -> int:
+        """Delete multiple jobs by ID using a single sheet batch request."""
+        # Blank IDs would match rows whose id cell is empty
+        wanted = {str(job_id) for job_id in job_ids if job_id}
+        if not wanted:
+            return 0
+
+        worksheet = self.get_worksheet('jobs')
+
+        try:
+            row_by_id = {}
+            for row_idx, job_id in enumerate(worksheet.col_values(1)[1:], start=2):
+                if job_id in wanted:
+                    row_by_id.setdefault(job_id, row_idx)
+
+            if not row_by_id:
+                return 0
+
+            # Delete bottom-up so each deletion leaves the remaining row numbers valid
+            requests = [
+                {
+                    'deleteDimension': {
+                        'range': {
+                            'sheetId': worksheet.id,
+                            'dimension': 'ROWS',
+                            'startIndex': row_idx - 1,
+                            'endIndex': row_idx
+                        }
+                    }
+                }
+                for row_idx in sorted(row_by_id.values(), reverse=True)
+            ]
+            self.spreadsheet.batch_update({'requests': requests})
+
+            return len(requests)
+        except _STALE_WORKSHEET_ERRORS:
+            raise
+        except Exception as e:
+            print(f"Error batch deleting jobs: {e}")
+            return 0
+    
     # ============ TECHNICIANS ============
     
+    @_retry_stale_worksheet(default=[])
     def get_all_technicians(self) -> List[Dict[str, Any]]:
         """Get all technicians from the sheet"""
         try:
@@ -334,10 +473,13 @@ class GoogleSheetsClient:
                     record['commission_rate'] = 0.5
             
             return records
+        except _STALE_WORKSHEET_ERRORS:
+            raise
         except Exception as e:
             print(f"Error getting technicians: {e}")
             return []
     
+    @_retry_stale_worksheet()
     def add_technician(self, tech_data: Dict[str, Any]) -> Dict[str, Any]:
         """Add a new technician"""
         worksheet = self.get_worksheet('technicians')
@@ -354,18 +496,17 @@ class GoogleSheetsClient:
         
         return tech_data
     
+    @_retry_stale_worksheet(default=None)
     def update_technician(self, tech_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a technician by ID"""
         worksheet = self.get_worksheet('technicians')
         
         try:
-            cell = worksheet.find(tech_id, in_column=1)
-            if not cell:
+            row_num = self._find_row(worksheet, tech_id)
+            if not row_num:
                 return None
             
-            row_num = cell.row
-            headers = worksheet.row_values(1)
-            current_row = worksheet.row_values(row_num)
+            headers, current_row = self._read_header_and_row(worksheet, row_num)
             
             # Build updated data
             updated_data = {}
@@ -375,24 +516,32 @@ class GoogleSheetsClient:
             
             updated_data.update(updates)
             
-            # Update row
+            # Update row (skipped when nothing changed)
             new_row = [updated_data.get(h, '') for h in headers]
-            worksheet.update(f'A{row_num}', [new_row])
+            current_values = [current_row[i] if i < len(current_row) else '' for i in range(len(headers))]
+            if not all(self._cell_unchanged(value, current)
+                       for value, current in zip(new_row, current_values)):
+                worksheet.update(f'A{row_num}', [new_row])
             
             return updated_data
+        except _STALE_WORKSHEET_ERRORS:
+            raise
         except Exception as e:
             print(f"Error updating technician: {e}")
             return None
     
+    @_retry_stale_worksheet(default=False)
     def delete_technician(self, tech_id: str) -> bool:
         """Delete a technician by ID"""
         worksheet = self.get_worksheet('technicians')
         
         try:
-            cell = worksheet.find(tech_id, in_column=1)
-            if cell:
-                worksheet.delete_rows(cell.row)
+            row_num = self._find_row(worksheet, tech_id)
+            if row_num:
+                worksheet.delete_rows(row_num)
                 return True
+        except _STALE_WORKSHEET_ERRORS:
+            raise
         except Exception as e:
             print(f"Error deleting technician: {e}")
         
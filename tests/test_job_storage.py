@@ -110,3 +110,39 @@ class TestJobStorageLocalFlow:
         all_unpaid = storage._get_all_jobs_local()
         assert all(not j.is_paid for j in all_unpaid)
         assert all(j.paid_date is None for j in all_unpaid)
+
+    def test_delete_jobs_batch(self, tmp_path):
+        storage = JobStorage(data_dir=str(tmp_path))
+
+        jobs = [
+            StoredJob(
+                id="",
+                technician_id="tech-1",
+                technician_name="John",
+                address=address,
+                total=300,
+                parts=0,
+                payment_method="cash",
+                description="",
+                phone="",
+                job_date="2026-01-10",
+                created_at="",
+            )
+            for address in ("123 Main St", "456 Elm Ave", "789 Oak Rd")
+        ]
+        saved_jobs = storage.add_jobs(jobs)
+        ids = [j.id for j in saved_jobs]
+
+        deleted_count = storage.delete_jobs([ids[0], ids[2], "missing-id"])
+        assert deleted_count == 2
+
+        remaining = storage._get_all_jobs_local()
+        assert [j.id for j in remaining] == [ids[1]]
+        assert storage.delete_jobs([]) == 0
+        assert storage.delete_jobs(["", None]) == 0
+        assert storage.delete_jobs([ids[1], ids[1]]) == 1
+
+        # Like delete_job, every row sharing a deleted ID is removed
+        storage._save_jobs_local(saved_jobs + saved_jobs)
+        assert storage.delete_jobs([ids[0]]) == 1
+        assert ids[0] not in [j.id for j in storage._get_all_jobs_local()]
@@ -3,6 +3,8 @@ import sys
 from pathlib import Path
 from datetime import date
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -87,3 +89,163 @@ Mike
         assert jobs[1].payment_method == "check"
         assert jobs[1].total == 500
         assert jobs[1].technician_name == "Mike"
+
+    def test_standalone_price_is_matched_per_line(self):
+        text = """
+14 Hill St
+alpha job
+
+  400$
+Gal
+""".strip()
+
+        job = self.parser.parse_single_job(text)
+
+        assert job is not None
+        assert job.total == 400
+        assert job.payment_method == "cash"
+        assert job.technician_name == "Gal"
+
+    def test_price_with_dollar_on_both_sides_is_not_standalone(self):
+        text = """
+14 Hill St
+$400$
+$446
+Gal
+""".strip()
+
+        job = self.parser.parse_single_job(text)
+
+        assert job is not None
+        assert job.total == 446
+        assert self.parser.parse_multiple_jobs("Hello\n$400$\nMike") == []
+
+    def test_parse_single_job_is_memoized_by_text(self):
+        text = """
+14 Hill St
+alpha job
+$400
+Gal
+""".strip()
+
+        MessageParser.cache_clear()
+        first = self.parser.parse_single_job(text)
+        second = MessageParser().parse_single_job(text)
+
+        assert first is second
+        assert MessageParser.cache_info().hits == 1
+
+    def test_memoized_parse_honours_subclass_overrides(self):
+        class FixedPartsParser(MessageParser):
+            def _extract_parts(self, text):
+                return 12.0
+
+        text = "14 Hill St\nalpha job\n$400\nGal"
+
+        assert self.parser.parse_single_job(text).parts == 0
+        assert FixedPartsParser().parse_single_job(text).parts == 12.0
+
+    def test_parse_multiple_jobs_parallel_matches_serial(self):
+        block = """
+123 Main St, White Plains, NY 10601
+alpha job
+$300
+Parts $20
+John
+""".strip()
+        text = "\n\n".join([block] * MessageParser.PARALLEL_MIN_BLOCKS)
+
+        serial = self.parser.parse_multiple_jobs(text)
+        parallel = self.parser.parse_multiple_jobs(text, max_workers=2)
+
+        assert len(serial) == MessageParser.PARALLEL_MIN_BLOCKS
+        assert parallel == serial
+
+    def test_long_address_line_without_zip_does_not_backtrack(self):
+        text = "1 Main St " * 200 + "\n$300\nJohn"
+
+        job = self.parser.parse_single_job(text)
+
+        assert job is not None
+        assert job.address.startswith("1 Main St")
+        assert job.total == 300
+
+    def test_long_address_line_with_unreachable_zip_does_not_backtrack(self):
+        text = "1 Main St " * 200 + "\n$300\nPaid, NY 10601\nJohn"
+
+        job = self.parser.parse_single_job(text)
+
+        # No standard address is reachable, so the first street line is used
+        assert job is not None
+        assert job.address == ("1 Main St " * 200).strip()
+        assert job.total == 300
+        assert job.technician_name == "John"
+
+    def test_standard_address_runs_to_the_last_reachable_zip(self):
+        text = "14 Hill St White Plains NY 10601 or Stamford CT 06901\n$400\nGal"
+
+        job = self.parser.parse_single_job(text)
+
+        assert job.address == "14 Hill St White Plains NY 10601 or Stamford CT 06901"
+        assert job.description == ""
+
+    def test_parse_multiple_jobs_without_digits_returns_empty(self):
+        text = """
+שלום, מה קורה
+total cash ,
+Oren
+""".strip()
+
+        assert self.parser.parse_multiple_jobs(text) == []
+
+    def test_parse_single_job_skips_unrequested_fields(self):
+        text = """
+Addr: 123 Main St, White Plains, NY 10601
+Desc: Lockout front door
+Ph: (914) 555-1212
+date: 1/5/26
+Total cash 450
+John
+""".strip()
+
+        job = self.parser.parse_single_job(text, fields=frozenset({'phone'}))
+
+        assert job is not None
+        assert job.total == 450
+        assert job.phone == "(914) 555-1212"
+        assert job.description == ""
+        assert job.job_date is None
+        assert job.technician_name == ""
+
+    def test_fields_accepts_any_iterable_of_names(self):
+        text = "14 Hill St\nalpha job\n$400\n(914) 555-1212\nGal"
+
+        expected = self.parser.parse_single_job(text, fields=frozenset({'phone'}))
+
+        assert self.parser.parse_single_job(text, fields={'phone'}) == expected
+        assert self.parser.parse_single_job(text, fields=['phone']) == expected
+        assert self.parser.parse_multiple_jobs(text, fields=['phone']) == [expected]
+
+    def test_fields_rejects_unknown_names(self):
+        with pytest.raises(ValueError, match="date"):
+            self.parser.parse_single_job("14 Hill St\n$400\nGal", fields={'date'})
+        with pytest.raises(ValueError):
+            self.parser.parse_multiple_jobs("14 Hill St\n$400\nGal", fields=['phone', 'adress'])
+
+    def test_iter_jobs_yields_jobs_lazily(self):
+        text = """
+123 Main St, White Plains, NY 10601
+alpha job
+$300
+John
+
+45 Oak Ave, Yonkers, NY 10701
+Total cash 250
+Dana
+""".strip()
+
+        jobs = self.parser.iter_jobs(text)
+
+        first = next(jobs)
+        assert first.technician_name == "John"
+        assert [first, *jobs] == self.parser.parse_multiple_jobs(text)
@@ -0,0 +1,179 @@
+"""Google Sheets backend tests against an in-memory worksheet."""
+import sys
+from pathlib import Path
+
+import gspread
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.sheets_storage import GoogleSheetsClient, JOB_HEADERS
+
+
+class FakeWorksheet:
+    """Minimal stand-in for gspread.Worksheet that records writes."""
+
+    def __init__(self, title, rows):
+        self.title = title
+        self.rows = [list(row) for row in rows]
+        self.updates = []
+        self.batch_updates = []
+        self.reads = []
+
+    def row_values(self, row):
+        self.reads.append(('row_values', row))
+        return list(self.rows[row - 1]) if row <= len(self.rows) else []
+
+    def col_values(self, col):
+        self.reads.append(('col_values', col))
+        return [row[col - 1] if col <= len(row) else '' for row in self.rows]
+
+    def batch_get(self, ranges, value_render_option=None, **kwargs):
+        # Rows hold unformatted values, so only serve what the client asks for
+        assert value_render_option == 'UNFORMATTED_VALUE'
+        self.reads.append(('batch_get', tuple(ranges)))
+        results = []
+        for a1 in ranges:
+            row = int(a1.split(':')[0])
+            results.append([list(self.rows[row - 1])] if row <= len(self.rows) else [])
+        return results
+
+    def update(self, range_name, values):
+        self.updates.append((range_name, values))
+
+    def batch_update(self, data, **kwargs):
+        self.batch_updates.append(data)
+
+
+def make_client(*worksheets):
+    """Build a client around fake worksheets without connecting to Google."""
+    client = GoogleSheetsClient.__new__(GoogleSheetsClient)
+    client.client = None
+    client.spreadsheet = None
+    client._worksheets = {ws.title: ws for ws in worksheets}
+    return client
+
+
+def job_row(**values):
+    return [values.get(header, '') for header in JOB_HEADERS]
+
+
+class TestUpdateJobSkipsNoOpWrites:
+    def test_unchanged_bool_and_float_send_no_batch_update(self):
+        worksheet = FakeWorksheet('jobs', [
+            JOB_HEADERS,
+            job_row(id='job-1', total=450, is_paid=True),
+        ])
+        client = make_client(worksheet)
+
+        record = client.update_job('job-1', {'is_paid': True, 'total': 450.0})
+
+        assert worksheet.batch_updates == []
+        assert record['is_paid'] is True
+        assert record['total'] == 450.0
+
+    def test_changed_value_is_written(self):
+        worksheet = FakeWorksheet('jobs', [
+            JOB_HEADERS,
+            job_row(id='job-1', total=450, is_paid=True),
+        ])
+        client = make_client(worksheet)
+
+        client.update_job('job-1', {'is_paid': False, 'total': 450.0})
+
+        assert len(worksheet.batch_updates) == 1
+        assert [cell['values'] for cell in worksheet.batch_updates[0]] == [[['false']]]
+
+    def test_value_hidden_by_cell_rounding_is_written(self):
+        # A "0" number format would display 449.6 as "450"
+        worksheet = FakeWorksheet('jobs', [JOB_HEADERS, job_row(id='job-1', total=449.6)])
+        client = make_client(worksheet)
+
+        client.update_job('job-1', {'total': 450.0})
+
+        assert [cell['values'] for cell in worksheet.batch_updates[0]] == [[[450.0]]]
+
+    def test_reads_header_and_row_in_one_request(self):
+        worksheet = FakeWorksheet('jobs', [JOB_HEADERS, job_row(id='job-1', total=450)])
+        client = make_client(worksheet)
+
+        client.update_job('job-1', {'total': 500.0})
+
+        assert worksheet.reads == [('col_values', 1), ('batch_get', ('1:1', '2:2'))]
+
+
+class StaleWorksheet:
+    """Handle to a tab that was deleted or renamed by hand."""
+
+    title = 'jobs'
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise gspread.exceptions.WorksheetNotFound(self.title)
+        return fail
+
+
+class FakeSpreadsheet:
+    def __init__(self, *worksheets):
+        self.worksheets = {ws.title: ws for ws in worksheets}
+        self.batch_updates = []
+
+    def worksheet(self, name):
+        return self.worksheets[name]
+
+    def batch_update(self, body):
+        self.batch_updates.append(body)
+
+
+class TestDeleteJobs:
+    def make_client(self):
+        worksheet = FakeWorksheet('jobs', [
+            JOB_HEADERS,
+            job_row(id='job-1'),
+            job_row(id=''),
+            job_row(id='job-2'),
+        ])
+        worksheet.id = 0
+        client = make_client(worksheet)
+        client.spreadsheet = FakeSpreadsheet()
+        return client
+
+    def test_blank_ids_delete_nothing(self):
+        client = self.make_client()
+
+        assert client.delete_jobs(['', None]) == 0
+        assert client.spreadsheet.batch_updates == []
+
+    def test_deletes_one_row_per_id(self):
+        client = self.make_client()
+
+        assert client.delete_jobs(['job-2', '', 'job-2']) == 1
+        requests = client.spreadsheet.batch_updates[0]['requests']
+        assert [r['deleteDimension']['range']['startIndex'] for r in requests] == [3]
+
+
+class TestStaleWorksheetHandles:
+    def test_stale_handle_is_refetched_and_call_retried(self):
+        worksheet = FakeWorksheet('jobs', [JOB_HEADERS, job_row(id='job-1', total=450)])
+        client = make_client(StaleWorksheet())
+        client.spreadsheet = FakeSpreadsheet(worksheet)
+
+        client.update_job('job-1', {'total': 500.0})
+
+        assert client._worksheets['jobs'] is worksheet
+        assert len(worksheet.batch_updates) == 1
+
+
+class TestUpdateTechnician:
+    def test_reads_header_and_row_in_one_request(self):
+        worksheet = FakeWorksheet('technicians', [
+            ['id', 'name', 'commission_rate', 'created_at'],
+            ['tech-1', 'John', 0.5, '2026-01-05'],
+        ])
+        client = make_client(worksheet)
+
+        updated = client.update_technician('tech-1', {'name': 'Johnny'})
+
+        assert updated['name'] == 'Johnny'
+        assert worksheet.reads == [('col_values', 1), ('batch_get', ('1:1', '2:2'))]
+        assert worksheet.updates == [('A2', [['tech-1', 'Johnny', 0.5, '2026-01-05']])]